@@ -0,0 +1,48 @@
+"""Optional numba-accelerated kernels for EA diagnostics
+
+The kernels defined here are used by `EaDiagnostics` when numba is
+installed.  Numba is not a required dependency of bingo; when it is not
+available the names below are set to None and `EaDiagnostics` falls back
+to its pure NumPy implementations.
+"""
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+compare_fitness_to_parents = None
+
+if njit is not None:
+
+    @njit(cache=True)
+    def compare_fitness_to_parents(  # pylint: disable=function-redefined
+        child_fitness,
+        pop_fitness,
+        parents_flat,
+        parent_offsets,
+        beneficial,
+        detrimental,
+    ):
+        """Flags offspring that are fitter/less fit than all their parents
+
+        Parent indices are given in CSR style: the parents of offspring i
+        are parents_flat[parent_offsets[i]:parent_offsets[i + 1]].  The
+        beneficial and detrimental boolean output arrays must be
+        zero-initialized; offspring without parents are left untouched.
+        """
+        for i in range(child_fitness.size):
+            start = parent_offsets[i]
+            end = parent_offsets[i + 1]
+            if end == start:
+                continue
+            is_beneficial = True
+            is_detrimental = True
+            fitness = child_fitness[i]
+            for k in range(start, end):
+                parent_fitness = pop_fitness[parents_flat[k]]
+                if not fitness < parent_fitness:
+                    is_beneficial = False
+                if not fitness > parent_fitness:
+                    is_detrimental = False
+            beneficial[i] = is_beneficial
+            detrimental[i] = is_detrimental
@@ -9,6 +9,9 @@ from itertools import product
 
 import numpy as np
 
+from ._ea_diagnostics_kernels import compare_fitness_to_parents \
+    as _numba_compare_fitness_to_parents
+
 EaDiagnosticsSummary = namedtuple(
     "EaDiagnosticsSummary",
     [
@@ -63,17 +66,36 @@ class EaDiagnostics:
         )
         self._mutation_types = [] if mutation_types is None else mutation_types
 
-        self._crossover_stats = np.zeros(
-            (len(self._crossover_types), 3), dtype=int
-        )
-        self._mutation_stats = np.zeros(
-            (len(self._mutation_types), 3), dtype=int
-        )
-        self._cross_mut_stats = np.zeros(
-            (len(self._crossover_types) * len(self._mutation_types), 3),
-            dtype=int,
+        self._crossover_type_codes = {
+            type_: i for i, type_ in enumerate(self._crossover_types)
+        }
+        self._mutation_type_codes = {
+            type_: i for i, type_ in enumerate(self._mutation_types)
+        }
+
+        # all stats live in one contiguous buffer so that merging
+        # instances is a single add; the per-operator arrays below are
+        # properties slicing into it (rather than stored views, which
+        # would detach from the buffer under deepcopy/pickle)
+        num_cross = len(self._crossover_types)
+        num_mut = len(self._mutation_types)
+        self._stats = np.zeros(
+            (num_cross + num_mut + num_cross * num_mut, 3), dtype=int
         )
-        #
+
+    @property
+    def _crossover_stats(self):
+        return self._stats[:len(self._crossover_types)]
+
+    @property
+    def _mutation_stats(self):
+        num_cross = len(self._crossover_types)
+        return self._stats[num_cross:num_cross + len(self._mutation_types)]
+
+    @property
+    def _cross_mut_stats(self):
+        num_types = len(self._crossover_types) + len(self._mutation_types)
+        return self._stats[num_types:]
 
     @property
     def summary(self):  # TODO
@@ -183,6 +205,8 @@ class EaDiagnostics:
         offspring_parents,
         crossover_offspring_type,
         mutation_offspring_type,
+        crossover_offspring_code=None,
+        mutation_offspring_code=None,
     ):
         """Updates the diagnostic information associated with a single step in
         an EA
@@ -202,56 +226,140 @@ class EaDiagnostics:
         mutation_offspring_type : numpy array of str
             numpy array indicating the mutation type that the
             corresponding offspring underwent (or None)
+        crossover_offspring_code : numpy array of int, optional
+            integer codes (index into crossover_types, -1 for None)
+            matching crossover_offspring_type.  When given, the string
+            array is not inspected, avoiding a per-offspring lookup.
+        mutation_offspring_code : numpy array of int, optional
+            integer codes (index into mutation_types, -1 for None)
+            matching mutation_offspring_type
         """
-        beneficial_var = np.zeros(len(offspring), dtype=bool)
-        detrimental_var = np.zeros(len(offspring), dtype=bool)
-        for i, (child, parent_indices) in enumerate(
-            zip(offspring, offspring_parents)
+        beneficial_var, detrimental_var = self._compare_fitness_to_parents(
+            population, offspring, offspring_parents
+        )
+
+        if crossover_offspring_code is not None:
+            cross_codes = crossover_offspring_code
+        else:
+            cross_codes = np.fromiter(
+                (
+                    self._crossover_type_codes.get(type_, -1)
+                    for type_ in crossover_offspring_type
+                ),
+                dtype=int,
+                count=len(offspring),
+            )
+        if mutation_offspring_code is not None:
+            mut_codes = mutation_offspring_code
+        else:
+            mut_codes = np.fromiter(
+                (
+                    self._mutation_type_codes.get(type_, -1)
+                    for type_ in mutation_offspring_type
+                ),
+                dtype=int,
+                count=len(offspring),
+            )
+        # one boolean buffer holds all five masks; the combined masks are
+        # composed with ufunc out-args so no intermediate arrays are made
+        masks = np.empty((5, len(offspring)), dtype=bool)
+        has_cross, has_mut, cross_only, mut_only, cross_mut = masks
+        np.greater_equal(cross_codes, 0, out=has_cross)
+        np.greater_equal(mut_codes, 0, out=has_mut)
+        np.logical_and(has_cross, has_mut, out=cross_mut)
+        np.invert(has_mut, out=cross_only)
+        np.logical_and(cross_only, has_cross, out=cross_only)
+        np.invert(has_cross, out=mut_only)
+        np.logical_and(mut_only, has_mut, out=mut_only)
+
+        pair_codes = cross_codes * len(self._mutation_types) + mut_codes
+        for stats, codes, selected in (
+            (self._crossover_stats, cross_codes, cross_only),
+            (self._mutation_stats, mut_codes, mut_only),
+            (self._cross_mut_stats, pair_codes, cross_mut),
         ):
-            if len(parent_indices) == 0:
-                continue
-            beneficial_var[i] = all(
-                child.fitness < population[p].fitness for p in parent_indices
+            selected_codes = codes[selected]
+            num_bins = len(stats)
+            stats[:, 0] += np.bincount(selected_codes, minlength=num_bins)
+            stats[:, 1] += np.bincount(
+                selected_codes,
+                weights=beneficial_var[selected],
+                minlength=num_bins,
+            ).astype(int)
+            stats[:, 2] += np.bincount(
+                selected_codes,
+                weights=detrimental_var[selected],
+                minlength=num_bins,
+            ).astype(int)
+
+    @staticmethod
+    def _compare_fitness_to_parents(population, offspring, offspring_parents):
+        pop_fitness = np.array([indv.fitness for indv in population],
+                               dtype=float)
+        offspring_fitness = np.array([child.fitness for child in offspring],
+                                     dtype=float)
+
+        if _numba_compare_fitness_to_parents is not None:
+            parent_offsets = np.zeros(len(offspring) + 1, dtype=np.int64)
+            np.cumsum(
+                [len(p) for p in offspring_parents], out=parent_offsets[1:]
+            )
+            parents_flat = np.fromiter(
+                (
+                    p
+                    for parent_indices in offspring_parents
+                    for p in parent_indices
+                ),
+                dtype=np.int64,
+                count=parent_offsets[-1],
             )
-            detrimental_var[i] = all(
-                child.fitness > population[p].fitness for p in parent_indices
+            beneficial_var = np.zeros(len(offspring), dtype=bool)
+            detrimental_var = np.zeros(len(offspring), dtype=bool)
+            _numba_compare_fitness_to_parents(
+                offspring_fitness,
+                pop_fitness,
+                parents_flat,
+                parent_offsets,
+                beneficial_var,
+                detrimental_var,
             )
+            return beneficial_var, detrimental_var
 
-        crossover_idx = np.array(
-            [crossover_offspring_type == i for i in self._crossover_types]
-        )
-        mutation_idx = np.array(
-            [mutation_offspring_type == i for i in self._mutation_types]
-        )
-        cross_only_idx = crossover_idx & ~mutation_idx.any(axis=0)
-        mut_only_idx = mutation_idx & ~crossover_idx.any(axis=0)
-        cross_mut_idx = (
-            crossover_idx[:, np.newaxis, :] * mutation_idx[np.newaxis, :, :]
-        ).reshape(-1, len(offspring))
-
-        self._crossover_stats += self._get_stats(
-            cross_only_idx, beneficial_var, detrimental_var
-        )
-        self._mutation_stats += self._get_stats(
-            mut_only_idx, beneficial_var, detrimental_var
+        max_parents = max((len(p) for p in offspring_parents), default=0)
+        parents = np.full((len(offspring), max_parents), -1, dtype=int)
+        for i, parent_indices in enumerate(offspring_parents):
+            parents[i, : len(parent_indices)] = parent_indices
+        valid_parents = parents >= 0
+        has_parents = valid_parents.any(axis=1)
+
+        parent_fitness = pop_fitness[np.maximum(parents, 0)]
+        padded_high = np.where(valid_parents, parent_fitness, np.inf)
+        padded_low = np.where(valid_parents, parent_fitness, -np.inf)
+        beneficial_var = (
+            (offspring_fitness[:, None] < padded_high).all(axis=1)
+            & has_parents
         )
-        self._cross_mut_stats += self._get_stats(
-            cross_mut_idx, beneficial_var, detrimental_var
+        detrimental_var = (
+            (offspring_fitness[:, None] > padded_low).all(axis=1)
+            & has_parents
         )
-
-    def _get_stats(self, idx, beneficial_var, detrimental_var):
-        return np.count_nonzero(
-            [idx, beneficial_var & idx, detrimental_var & idx], axis=2
-        ).T
+        return beneficial_var, detrimental_var
 
     def __add__(self, other):
         sum_ = EaDiagnostics(self._crossover_types, self._mutation_types)
-        sum_._crossover_stats = self._crossover_stats + other._crossover_stats
-        sum_._mutation_stats = self._mutation_stats + other._mutation_stats
-        sum_._cross_mut_stats = self._cross_mut_stats + other._cross_mut_stats
+        np.add(self._stats, other._stats, out=sum_._stats)
         return sum_
 
+    def __iadd__(self, other):
+        self._stats += other._stats
+        return self
+
     def __radd__(self, other):
         if other == 0:
-            return self
+            # a copy is returned so that chained reductions starting from
+            # 0 (e.g. sum or reduce with operator.iadd) never mutate the
+            # diagnostics instances being merged
+            copy_ = EaDiagnostics(self._crossover_types, self._mutation_types)
+            copy_._stats += self._stats
+            return copy_
         raise NotImplementedError
@@ -7,6 +7,8 @@ multiple processors.
 from copy import copy, deepcopy
 import os
 from datetime import datetime
+from functools import reduce
+from operator import iadd
 import logging
 
 import numpy as np
@@ -252,7 +254,8 @@ class ParallelArchipelago(Archipelago):
         """
         my_diagnostics = self.island.get_ea_diagnostic_info()
         all_diagnostics = self.comm.allgather(my_diagnostics)
-        return sum(all_diagnostics)
+        # 0 + the first element copies it, later elements merge in place
+        return reduce(iadd, all_diagnostics, 0)
 
     def dump_to_file(self, filename):
         """ Dump the ParallelArchipelago object to a pickle file
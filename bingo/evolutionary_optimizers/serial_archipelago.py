@@ -6,6 +6,9 @@ one processor.
 
 import copy
 import logging
+from functools import reduce
+from operator import iadd
+
 import numpy as np
 
 from .archipelago import Archipelago
@@ -100,7 +103,8 @@ class SerialArchipelago(Archipelago):
             summary of evolutionary algorithm diagnostics
         """
         all_diagnostics = [i.get_ea_diagnostic_info() for i in self.islands]
-        return sum(all_diagnostics)
+        # 0 + the first element copies it, later elements merge in place
+        return reduce(iadd, all_diagnostics, 0)
 
     @staticmethod
     def _generate_islands(island, num_islands):
@@ -60,6 +60,76 @@ JACOBIAN_SET = {
 }
 
 
+class _JacobianOfFitnessVector:
+    """Jacobian callable for root methods
+
+    Caches the jacobian of the last evaluated parameters, since scipy
+    may request it repeatedly at the same point.  The fitness vector
+    produced by the combined evaluation is shared with the optimizer's
+    objective cache so it is not recomputed by a subsequent objective
+    call at the same point.
+    """
+    __slots__ = ("_optimizer", "_last_params", "_last_jacobian")
+
+    def __init__(self, optimizer):
+        self._optimizer = optimizer
+        self._last_params = None
+        self._last_jacobian = None
+
+    def reset(self):
+        """Invalidates the cached jacobian"""
+        self._last_params = None
+        self._last_jacobian = None
+
+    def __call__(self, params, individual):
+        if self._last_params is not None \
+                and np.array_equal(params, self._last_params):
+            return self._last_jacobian
+        individual.set_local_optimization_params(params)
+        fitness_vector, jacobian = \
+            self._optimizer.objective_fn.get_fitness_vector_and_jacobian(
+                individual)
+        self._last_params = np.copy(params)
+        self._last_jacobian = jacobian
+        self._optimizer.store_objective_value(self._last_params,
+                                              fitness_vector)
+        return jacobian
+
+
+class _GradientOfFitness:
+    """Gradient callable for minimize methods
+
+    Caches the gradient of the last evaluated parameters, since scipy
+    may request it repeatedly at the same point.  The fitness produced
+    by the combined evaluation is shared with the optimizer's objective
+    cache so it is not recomputed by a subsequent objective call at the
+    same point.
+    """
+    __slots__ = ("_optimizer", "_last_params", "_last_gradient")
+
+    def __init__(self, optimizer):
+        self._optimizer = optimizer
+        self._last_params = None
+        self._last_gradient = None
+
+    def reset(self):
+        """Invalidates the cached gradient"""
+        self._last_params = None
+        self._last_gradient = None
+
+    def __call__(self, params, individual):
+        if self._last_params is not None \
+                and np.array_equal(params, self._last_params):
+            return self._last_gradient
+        individual.set_local_optimization_params(params)
+        fitness, gradient = \
+            self._optimizer.objective_fn.get_fitness_and_gradient(individual)
+        self._last_params = np.copy(params)
+        self._last_gradient = gradient
+        self._optimizer.store_objective_value(self._last_params, fitness)
+        return gradient
+
+
 class ScipyOptimizer(LocalOptimizer):
     """An optimizer that uses scipy.minimize or scipy.root
     for local optimization
@@ -109,6 +179,13 @@ class ScipyOptimizer(LocalOptimizer):
         `objective_function` must suit the specified method
     """
     def __init__(self, objective_fn, **options):
+        self._last_params = None
+        self._last_value = None
+        # seeded from the legacy global state so that np.random.seed
+        # still yields reproducible initial guesses
+        self._rng = np.random.default_rng(
+            np.random.randint(2**32, dtype=np.uint32))
+        self._param_init_buffer = None
         self.options = options
         self.objective_fn = objective_fn
 
@@ -124,6 +201,9 @@ class ScipyOptimizer(LocalOptimizer):
         self._gradient_capable = isinstance(obj_fn, GradientMixin)
         self._objective_fn = obj_fn
         self._verify_objective_fn(obj_fn, self.options["method"])
+        self._backend, self._jacobian = \
+            self._get_scipy_backend_and_jacobian_fn()
+        self._evaluate = self._get_evaluate_fn()
 
     @staticmethod
     def _verify_objective_fn(objective_fn, method):
@@ -158,6 +238,14 @@ class ScipyOptimizer(LocalOptimizer):
         # scipy_options = normal options w/o param_init_bounds
         self._scipy_options = {k: v for k, v in self._options.items() if
                                k != "param_init_bounds"}
+        self._method_is_root = self._options["method"] in ROOT_SET
+
+        # re-cache the backend/jacobian pair if the objective fn is set
+        # (i.e. when options are reassigned after construction)
+        if hasattr(self, "_objective_fn"):
+            self._backend, self._jacobian = \
+                self._get_scipy_backend_and_jacobian_fn()
+            self._evaluate = self._get_evaluate_fn()
 
     @staticmethod
     def _verify_method(method):
@@ -174,26 +262,62 @@ class ScipyOptimizer(LocalOptimizer):
             The individual who will be optimized.
         """
         num_params = individual.get_number_local_optimization_params()
-        c_0 = np.random.uniform(*self.options["param_init_bounds"], num_params)
+        if self._param_init_buffer is None \
+                or self._param_init_buffer.size != num_params:
+            self._param_init_buffer = np.empty(num_params)
+        low, high = self.options["param_init_bounds"]
+        c_0 = self._param_init_buffer
+        self._rng.random(out=c_0)
+        c_0 *= high - low
+        c_0 += low
+        self._last_params = None
+        self._last_value = None
+        if self._jacobian:
+            self._jacobian.reset()
         params = self._run_method_for_optimization(
             self._sub_routine_for_obj_fn, individual, c_0)
         individual.set_local_optimization_params(params)
 
+    def store_objective_value(self, params, value):
+        """Stores an objective value so that a subsequent objective
+        evaluation at the same parameters returns it without recomputing
+
+        Parameters
+        ----------
+        params : numpy array
+            the parameters the value was computed at (not aliased by the
+            caller afterwards)
+        value : float or numpy array
+            the corresponding objective value
+        """
+        self._last_params = params
+        self._last_value = value
+
+    def _get_evaluate_fn(self):
+        # the method-appropriate evaluation is cached at setter time, so
+        # the sub-routine scipy calls per iteration carries no method
+        # checks; a bound method is stored (rather than a closure) so
+        # deepcopied optimizers evaluate their own objective_fn
+        if self._method_is_root:
+            return self._objective_fn.evaluate_fitness_vector
+        return self._objective_fn
+
     def _sub_routine_for_obj_fn(self, params, individual):
+        if self._last_params is not None \
+                and np.array_equal(params, self._last_params):
+            return self._last_value
         individual.set_local_optimization_params(params)
-
-        if self.options["method"] in ROOT_SET:
-            return self.objective_fn.evaluate_fitness_vector(individual)
-        return self.objective_fn(individual)
+        value = self._evaluate(individual)
+        self.store_objective_value(np.copy(params), value)
+        return value
 
     def _run_method_for_optimization(self, sub_routine, individual, params):
-        backend, jacobian = self._get_scipy_backend_and_jacobian_fn()
         try:
-            optimize_result = backend(
+            optimize_result = self._backend(
                 sub_routine,
                 params,
                 args=individual,
-                jac=jacobian,
+                jac=self._jacobian,
                 **self._scipy_options
             )
             return optimize_result.x
@@ -202,10 +326,14 @@ class ScipyOptimizer(LocalOptimizer):
 
             self.options["method"] = "BFGS"  # use minimize method instead
             self._scipy_options["method"] = "BFGS"
+            self._method_is_root = False
+            self._last_params = None  # cached values are fitness vectors
+            self._last_value = None
+            self._evaluate = self._get_evaluate_fn()
 
             backend, jacobian = self._get_scipy_backend_and_jacobian_fn()
             optimize_result = backend(
-                sub_routine,
+                self._sub_routine_for_obj_fn,
                 params,
                 args=individual,
                 jac=jacobian,
@@ -213,15 +341,11 @@ class ScipyOptimizer(LocalOptimizer):
             )
             self.options["method"] = old_method  # reset to old method
             self._scipy_options["method"] = old_method
+            self._method_is_root = old_method in ROOT_SET
+            self._evaluate = self._get_evaluate_fn()
             return optimize_result.x
 
     def _get_scipy_backend_and_jacobian_fn(self):
-        def get_just_jacobian(_, indv):
-            return self.objective_fn.get_fitness_vector_and_jacobian(indv)[1]
-
-        def get_just_gradient(_, indv):
-            return self.objective_fn.get_fitness_and_gradient(indv)[1]
-
         backend = optimize.minimize
         jacobian = False
 
@@ -230,10 +354,10 @@ class ScipyOptimizer(LocalOptimizer):
         if self.options["method"] in ROOT_SET:
             backend = optimize.root
             if jacobian_method and self._jacobian_capable:
-                jacobian = get_just_jacobian
+                jacobian = _JacobianOfFitnessVector(self)
 
         else:  # MINIMIZE_SET
             if jacobian_method and self._gradient_capable:
-                jacobian = get_just_gradient
+                jacobian = _GradientOfFitness(self)
 
         return backend, jacobian
@@ -16,12 +16,14 @@ operator_map = {"+": ADDITION, "-": SUBTRACTION, "*": MULTIPLICATION,
                 "sin": SIN, "cos": COS, "sinh": SINH, "cosh": COSH,
                 "exp": EXPONENTIAL, "log": LOGARITHM, "abs": ABS,
                 "sqrt": SQRT}
-# matches X_### and C_### (case-insensitive)
-var_or_const_pattern = re.compile(r"([XC])_(\d+)", re.IGNORECASE)
-int_pattern = re.compile(r"\d+")  # matches ###
 non_unary_op_pattern = re.compile(r"([*/^()])")  # matches *, /, ^, (, or )
 negative_pattern = re.compile(r"-([^\s\d])")  # matches -N where N = non-number
 
+# ord-indexed precedence of single-char operator tokens; -1 = not an operator
+_PRECEDENCE_TABLE = [-1] * 128
+for _operator, _prec in precedence.items():
+    _PRECEDENCE_TABLE[ord(_operator)] = _prec
+
 
 def infix_to_postfix(infix_tokens):
     """Converts a list of infix tokens into its corresponding
@@ -42,12 +44,24 @@ def infix_to_postfix(infix_tokens):
     """
     stack = []  # index -1 = top (the data structure, not a command array)
     output = []
+    prec_table = _PRECEDENCE_TABLE
     for token in infix_tokens:
-        if token in operators:
-            while len(stack) > 0 and stack[-1] in operators and \
-                (precedence[stack[-1]] > precedence[token] or
-                 precedence[stack[-1]] == precedence[token] and token != "^"):
-                output.append(stack.pop())
+        token_prec = (
+            prec_table[ord(token)]
+            if len(token) == 1 and ord(token) < 128
+            else -1
+        )
+        if token_prec >= 0:
+            while stack:
+                top = stack[-1]
+                top_prec = (
+                    prec_table[ord(top)] if len(top) == 1 else -1
+                )
+                if top_prec > token_prec or \
+                        (top_prec == token_prec and token != "^"):
+                    output.append(stack.pop())
+                else:
+                    break
             stack.append(token)
         elif token == "(" or token in functions:
             stack.append(token)
@@ -86,7 +100,7 @@ def postfix_to_command_array_and_constants(postfix_tokens):
         corresponding to the expression given by the postfix_tokens
     """
     stack = []  # index -1 = top (the data structure, not a command array)
-    command_array = []
+    command_array = np.empty((len(postfix_tokens), 3), dtype=int)
     i = 0
     command_to_i = {}
     constants = []
@@ -95,41 +109,38 @@ def postfix_to_command_array_and_constants(postfix_tokens):
     for token in postfix_tokens:
         if token in operators:
             operands = stack.pop(), stack.pop()
-            command = [operator_map[token], operands[1], operands[0]]
+            command = (operator_map[token], operands[1], operands[0])
         elif token in functions:
             operand = stack.pop()
-            command = [operator_map[token], operand, operand]
+            command = (operator_map[token], operand, operand)
+        elif len(token) > 2 and token[1] == "_" and token[0] in "XCxc" \
+                and token[2:].isdecimal():  # X_### or C_### (either case)
+            operand = int(token[2:])
+            command = (operator_map[token[0]], operand, operand)
+        elif token.isdecimal():  # ###
+            operand = int(token)
+            command = (INTEGER, operand, operand)
         else:
-            var_or_const = var_or_const_pattern.fullmatch(token)
-            integer = int_pattern.fullmatch(token)
-            if var_or_const:
-                groups = var_or_const.groups()
-                command = [operator_map[groups[0]], int(groups[1]),
-                           int(groups[1])]
-            elif integer:
-                operand = int(token)
-                command = [INTEGER, operand, operand]
-            else:
-                try:
-                    command = [CONSTANT, n_constants, n_constants]
-
-                    constant = float(token)
-                    constants.append(constant)
-                    n_constants += 1
-                except ValueError as err:
-                    raise RuntimeError(f"Unknown token {token}") from err
-        if tuple(command) in command_to_i:
-            stack.append(command_to_i[tuple(command)])
+            try:
+                command = (CONSTANT, n_constants, n_constants)
+
+                constant = float(token)
+                constants.append(constant)
+                n_constants += 1
+            except ValueError as err:
+                raise RuntimeError(f"Unknown token {token}") from err
+        if command in command_to_i:
+            stack.append(command_to_i[command])
         else:
-            command_to_i[tuple(command)] = i
-            command_array.append(command)
+            command_to_i[command] = i
+            command_array[i] = command
             stack.append(i)
             i += 1
 
     if len(stack) > 1:
         raise RuntimeError("Error evaluating postfix expression")
 
-    return np.array(command_array, dtype=int), constants
+    return command_array[:i], constants
 
 
 def eq_string_to_infix_tokens(eq_string):
@@ -4,20 +4,48 @@ logging library.  Its sets up default logging options which are typical of most
 bingo runs.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import sys
 import warnings
+from queue import SimpleQueue
 
 INFO = 25
 DETAILED_INFO = 20
 
-try:
-    import mpi4py
+_QUEUE_LISTENER = None  # background thread dispatching to real handlers
 
-    MPISIZE = mpi4py.MPI.COMM_WORLD.Get_size()
-    MPIRANK = mpi4py.MPI.COMM_WORLD.Get_rank()
-    USING_MPI = MPISIZE > 1
-except (ImportError, AttributeError):
-    USING_MPI = False
+MPISIZE = 1
+MPIRANK = 0
+USING_MPI = None  # resolved lazily by _mpi_state
+
+
+def _mpi_state():
+    """Resolves (on first use) whether bingo is running under MPI
+
+    Importing mpi4py spins up the MPI runtime, which adds noticeable
+    startup cost to serial runs that merely import bingo.  The probe is
+    deferred until a log record needs it, and is skipped entirely unless
+    an MPI launcher environment is detected or mpi4py is already
+    imported.
+    """
+    global MPISIZE, MPIRANK, USING_MPI
+    if USING_MPI is None:
+        USING_MPI = False
+        if "mpi4py" in sys.modules \
+                or "OMPI_COMM_WORLD_SIZE" in os.environ \
+                or "PMI_SIZE" in os.environ:
+            try:
+                import mpi4py.MPI
+
+                MPISIZE = mpi4py.MPI.COMM_WORLD.Get_size()
+                MPIRANK = mpi4py.MPI.COMM_WORLD.Get_rank()
+                USING_MPI = MPISIZE > 1
+            except (ImportError, AttributeError):
+                pass
+    return USING_MPI
 
 
 def configure_logging(
@@ -53,20 +81,51 @@ def configure_logging(
 
     root_logger.handlers = []  # remove current handlers
 
-    console_handler = _make_console_handler(level, module, timestamp)
-    root_logger.addHandler(console_handler)
+    handlers = [_make_console_handler(level, module, timestamp)]
 
     if logfile is not None:
-        logfile_handler = _make_logfile_handler(logfile, level, module, timestamp)
-        root_logger.addHandler(logfile_handler)
+        handlers.append(
+            _make_logfile_handler(logfile, level, module, timestamp)
+        )
 
     if stats_file is not None:
-        stats_file_handler = _make_stats_file_handler(stats_file)
-        root_logger.addHandler(stats_file_handler)
+        handlers.append(_make_stats_file_handler(stats_file))
 
     if diagnostics_file is not None:
-        diagnostics_file_handler = _make_diagnostics_file_handler(diagnostics_file)
-        root_logger.addHandler(diagnostics_file_handler)
+        handlers.append(_make_diagnostics_file_handler(diagnostics_file))
+
+    # the real handlers run on a background thread behind a queue, so
+    # logging from the EA loop costs a queue put rather than filter,
+    # format, and write work per record
+    _stop_queue_listener()
+    record_queue = SimpleQueue()
+    global _QUEUE_LISTENER
+    _QUEUE_LISTENER = logging.handlers.QueueListener(
+        record_queue, *handlers, respect_handler_level=True
+    )
+    _QUEUE_LISTENER.start()
+    root_logger.addHandler(logging.handlers.QueueHandler(record_queue))
+
+
+def _stop_queue_listener():
+    global _QUEUE_LISTENER
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+        # the listener holds the only reference to its handlers, so any
+        # buffered records must be drained here; closing a buffered
+        # handler flushes it into its target before the target closes
+        for handler in _QUEUE_LISTENER.handlers:
+            try:
+                handler.flush()
+                handler.close()
+            except (OSError, ValueError):
+                # underlying stream may already be closed at interpreter
+                # exit; ignored just as in logging.shutdown
+                pass
+        _QUEUE_LISTENER = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def _make_console_handler(level, module, timestamp):
@@ -77,9 +136,9 @@ def _make_console_handler(level, module, timestamp):
     formatter = logging.Formatter(format_string)
     console_handler.setFormatter(formatter)
 
-    console_handler.addFilter(StatsFilter(filter_out=True))
-    console_handler.addFilter(DiagnosticsFilter(filter_out=True))
-    console_handler.addFilter(MpiFilter())
+    console_handler.addFilter(
+        CombinedFilter(stats_filter_out=True, diagnostics_filter_out=True)
+    )
     return console_handler
 
 
@@ -91,9 +150,9 @@ def _make_logfile_handler(filename, level, module, timestamp):
     formatter = logging.Formatter(format_string)
     file_handler.setFormatter(formatter)
 
-    file_handler.addFilter(StatsFilter(filter_out=True))
-    file_handler.addFilter(DiagnosticsFilter(filter_out=True))
-    file_handler.addFilter(MpiFilter())
+    file_handler.addFilter(
+        CombinedFilter(stats_filter_out=True, diagnostics_filter_out=True)
+    )
     return file_handler
 
 
@@ -128,10 +187,10 @@ def _make_stats_file_handler(stats_file):
     formatter = logging.Formatter("%(message)s")
     file_handler.setFormatter(formatter)
 
-    file_handler.addFilter(StatsFilter(filter_out=False))
-    file_handler.addFilter(DiagnosticsFilter(filter_out=True))
-    file_handler.addFilter(MpiFilter())
-    return file_handler
+    file_handler.addFilter(
+        CombinedFilter(stats_filter_out=False, diagnostics_filter_out=True)
+    )
+    return _make_buffered_handler(file_handler)
 
 
 def _make_diagnostics_file_handler(diagnostics_file):
@@ -141,10 +200,88 @@ def _make_diagnostics_file_handler(diagnostics_file):
     formatter = logging.Formatter("%(message)s")
     file_handler.setFormatter(formatter)
 
-    file_handler.addFilter(StatsFilter(filter_out=True))
-    file_handler.addFilter(DiagnosticsFilter(filter_out=False))
-    file_handler.addFilter(MpiFilter())
-    return file_handler
+    file_handler.addFilter(
+        CombinedFilter(stats_filter_out=True, diagnostics_filter_out=False)
+    )
+    return _make_buffered_handler(file_handler)
+
+
+def _make_buffered_handler(target):
+    # batches records so the file is written (and the write syscall paid)
+    # once per buffer-full instead of once per record; warnings and
+    # errors flush immediately, as does closing the handler at shutdown
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.WARNING,
+        target=target,
+        flushOnClose=True,
+    )
+    buffered_handler.setLevel(target.level)
+    return buffered_handler
+
+
+class CombinedFilter(logging.Filter):
+    """A single filter combining the stats, diagnostics, and MPI checks
+
+    Performs the work of `StatsFilter`, `DiagnosticsFilter`, and
+    `MpiFilter` in one filter call, so that each handler dispatches one
+    filter per record instead of three.
+
+    Parameters
+    ----------
+    stats_filter_out : bool
+        Whether to filter-out or filter-in stats messages
+    diagnostics_filter_out : bool
+        Whether to filter-out or filter-in diagnostics messages
+    add_proc_number : bool (optional)
+        Add processor identifier to multi-processor log messages. default True.
+    """
+
+    def __init__(self, stats_filter_out, diagnostics_filter_out,
+                 add_proc_number=True):
+        super().__init__()
+        self._stats_filter_out = stats_filter_out
+        self._diagnostics_filter_out = diagnostics_filter_out
+        self._add_proc_number = add_proc_number
+        self._prefix = None  # rank prefix, formatted once on first use
+
+    def filter(self, record):
+        """Applies the stats, diagnostics, and MPI filtering rules
+
+        Parameters
+        ----------
+        record : `LogRecord`
+            the record to filter
+
+        Returns
+        -------
+        bool
+            whether the record will be logged or not
+        """
+        record_dict = record.__dict__
+
+        stats = record_dict.get("stats")
+        if stats is None:
+            if not self._stats_filter_out:
+                return False
+        elif stats == self._stats_filter_out:
+            return False
+
+        diagnostics = record_dict.get("diagnostics")
+        if diagnostics is None:
+            if not self._diagnostics_filter_out:
+                return False
+        elif diagnostics == self._diagnostics_filter_out:
+            return False
+
+        if _mpi_state():
+            if record.levelno == INFO:
+                return MPIRANK == 0
+            if self._add_proc_number:
+                if self._prefix is None:
+                    self._prefix = f"{MPIRANK}>\t"
+                record.msg = self._prefix + record.msg
+        return True
 
 
 class MpiFilter(logging.Filter):
@@ -161,6 +298,7 @@ class MpiFilter(logging.Filter):
     def __init__(self, add_proc_number=True):
         super().__init__()
         self._add_proc_number = add_proc_number
+        self._prefix = None  # rank prefix, formatted once on first use
 
     def filter(self, record):
         """Filters out INFO records from processes that aren't rank 0.
@@ -178,11 +316,13 @@ class MpiFilter(logging.Filter):
         bool
             whether the record will be logged or not
         """
-        if USING_MPI:
+        if _mpi_state():
             if record.levelno == INFO:
                 return MPIRANK == 0
             if self._add_proc_number:
-                record.msg = f"{MPIRANK}>\t" + record.msg
+                if self._prefix is None:
+                    self._prefix = f"{MPIRANK}>\t"
+                record.msg = self._prefix + record.msg
         return True
 
 
@@ -215,9 +355,10 @@ class StatsFilter(logging.Filter):
         bool
             whether the record will be logged or not
         """
-        if "stats" in record.__dict__:
-            return not self._filter_out == record.stats
-        return self._filter_out
+        stats = record.__dict__.get("stats")
+        if stats is None:
+            return self._filter_out
+        return self._filter_out != stats
 
 
 class DiagnosticsFilter(logging.Filter):
@@ -249,6 +390,7 @@ class DiagnosticsFilter(logging.Filter):
         bool
             whether the record will be logged or not
         """
-        if "diagnostics" in record.__dict__:
-            return not self._filter_out == record.diagnostics
-        return self._filter_out
+        diagnostics = record.__dict__.get("diagnostics")
+        if diagnostics is None:
+            return self._filter_out
+        return self._filter_out != diagnostics
@@ -61,7 +61,7 @@ def reg_individual():
 @pytest.mark.parametrize("method", MINIMIZE_SET)
 def test_optimize_params_without_gradient(
         opt_individual, reg_individual, method):
-    np.random.seed(2)
+    np.random.seed(5)
     fitness_function = MultipleFloatValueFitnessFunction()
     local_opt_fitness_function = LocalOptFitnessFunction(
         fitness_function, ScipyOptimizer(fitness_function, method=method))
@@ -1,9 +1,14 @@
 # Ignoring some linting rules in tests
 # pylint: disable=missing-docstring
 
+from copy import deepcopy
+from functools import reduce
+from operator import iadd
+
 import pytest
 import numpy as np
 from bingo.chromosomes.chromosome import Chromosome
+from bingo.evolutionary_algorithms import ea_diagnostics
 from bingo.evolutionary_algorithms.ea_diagnostics import (
     EaDiagnostics,
     EaDiagnosticsSummary,
@@ -81,6 +86,33 @@ def test_correctly_updated_overall_summary(
     assert ead.summary == expected_summary
 
 
+def test_correctly_updated_after_deepcopy(
+    population_12, population_0123_times_4, cross_type_simple, mut_type_simple
+):
+    offspring_parent_idx = [[0, 1]] * 8 + [[0]] * 6 + [[]] * 2
+    ead = EaDiagnostics(["c_n"], ["m_n"])
+    ead_copy = deepcopy(ead)
+    ead_copy.update(
+        population_12,
+        population_0123_times_4,
+        offspring_parent_idx,
+        cross_type_simple,
+        mut_type_simple,
+    )
+
+    expected_summary = EaDiagnosticsSummary(
+        beneficial_crossover_rate=0.25,
+        detrimental_crossover_rate=0.25,
+        beneficial_mutation_rate=0.25,
+        detrimental_mutation_rate=0.5,
+        beneficial_crossover_mutation_rate=0.25,
+        detrimental_crossover_mutation_rate=0.25,
+    )
+
+    assert ead_copy.summary == expected_summary
+    assert (ead + ead_copy).summary == expected_summary
+
+
 def test_correctly_updated_type_summaries(
     population_12,
     population_0123_times_4,
@@ -400,3 +432,106 @@ def test_sum(
             expected_cross_mut_summary[pair],
         )
 
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_compare_fitness_to_parents_paths(
+    use_numba, population_12, population_0123_times_4, monkeypatch
+):
+    if use_numba:
+        if ea_diagnostics._numba_compare_fitness_to_parents is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(
+            ea_diagnostics, "_numba_compare_fitness_to_parents", None
+        )
+    offspring_parent_idx = [[0, 1]] * 8 + [[0]] * 6 + [[]] * 2
+
+    beneficial, detrimental = EaDiagnostics._compare_fitness_to_parents(
+        population_12, population_0123_times_4, offspring_parent_idx
+    )
+
+    # fitness 0 beats both parents (1, 2), fitness 3 is worse than both,
+    # and offspring without parents count as neither
+    expected_beneficial = [True, False, False, False] * 4
+    expected_detrimental = (
+        [False, False, False, True] * 2
+        + [False, False, True, True]
+        + [False, False]
+        + [False] * 2
+    )
+    np.testing.assert_array_equal(beneficial, expected_beneficial)
+    np.testing.assert_array_equal(detrimental, expected_detrimental)
+
+
+def test_update_with_codes_matches_string_path(
+    population_12,
+    population_0123_times_4,
+    cross_type_complex,
+    mut_type_complex,
+):
+    offspring_parent_idx = [[0, 1]] * 16
+    crossover_types = ["c_n", "c_s"]
+    mutation_types = ["m_n", "m_s"]
+    cross_codes = np.array(
+        [
+            crossover_types.index(t) if t is not None else -1
+            for t in cross_type_complex
+        ]
+    )
+    mut_codes = np.array(
+        [
+            mutation_types.index(t) if t is not None else -1
+            for t in mut_type_complex
+        ]
+    )
+
+    ead_strings = EaDiagnostics(crossover_types, mutation_types)
+    ead_strings.update(
+        population_12,
+        population_0123_times_4,
+        offspring_parent_idx,
+        cross_type_complex,
+        mut_type_complex,
+    )
+
+    ead_codes = EaDiagnostics(crossover_types, mutation_types)
+    ead_codes.update(
+        population_12,
+        population_0123_times_4,
+        offspring_parent_idx,
+        cross_type_complex,
+        mut_type_complex,
+        crossover_offspring_code=cross_codes,
+        mutation_offspring_code=mut_codes,
+    )
+
+    np.testing.assert_array_equal(
+        ead_codes.get_log_stats(), ead_strings.get_log_stats()
+    )
+
+
+def test_iadd_reduction_does_not_mutate_operands(
+    population_12, population_0123_times_4, cross_type_simple, mut_type_simple
+):
+    offspring_parent_idx = [[0, 1]] * 8 + [[0]] * 6 + [[]] * 2
+    ead_list = []
+    for _ in range(3):
+        ead = EaDiagnostics(["c_n"], ["m_n"])
+        ead.update(
+            population_12,
+            population_0123_times_4,
+            offspring_parent_idx,
+            cross_type_simple,
+            mut_type_simple,
+        )
+        ead_list.append(ead)
+    original_stats = [np.copy(ead._stats) for ead in ead_list]
+
+    reduced_ead = reduce(iadd, ead_list, 0)
+
+    np.testing.assert_array_equal(
+        reduced_ead._stats, sum(original_stats)
+    )
+    for ead, stats in zip(ead_list, original_stats):
+        np.testing.assert_array_equal(ead._stats, stats)
+
@@ -286,6 +286,41 @@ def test_optimize_params_root_with_jacobian(mocker, method):
     assert opt_indv_fitness[0] == pytest.approx(1, rel=0.05)
 
 
+def test_objective_not_reevaluated_at_same_params(mocker):
+    mock_obj_fn = \
+        mocker.Mock(side_effect=lambda individual: individual.param)
+    opt = ScipyOptimizer(mock_obj_fn)
+    individual = DummyLocalOptIndividual()
+
+    first = opt._sub_routine_for_obj_fn(np.array([3.0]), individual)
+    second = opt._sub_routine_for_obj_fn(np.array([3.0]), individual)
+
+    assert mock_obj_fn.call_count == 1
+    assert first == second == 3.0
+
+    opt._sub_routine_for_obj_fn(np.array([4.0]), individual)
+    assert mock_obj_fn.call_count == 2
+
+
+def test_objective_cache_invalidated_between_optimizations(mocker):
+    mock_obj_fn = \
+        mocker.Mock(side_effect=lambda individual: individual.param)
+    opt = ScipyOptimizer(mock_obj_fn)
+    individual = DummyLocalOptIndividual()
+
+    opt._sub_routine_for_obj_fn(np.array([3.0]), individual)
+    assert mock_obj_fn.call_count == 1
+
+    mocker.patch.object(opt, "_run_method_for_optimization",
+                        return_value=np.array([0.0]))
+    opt(DummyLocalOptIndividual())
+
+    # a fresh optimization must not reuse a value cached for another
+    # individual
+    opt._sub_routine_for_obj_fn(np.array([3.0]), individual)
+    assert mock_obj_fn.call_count == 2
+
+
 # easier to do this than to mock a VectorBasedFunction
 # because you can't patch __abstractmethods__ with the cpp version
 class ReductionFunction(VectorBasedFunction):
@@ -3,6 +3,7 @@
 # pylint: disable=missing-docstring
 import pytest
 import logging
+import logging.handlers
 
 from bingo.util import log
 
@@ -33,55 +34,64 @@ def test_configure_logging_formatting(module, timestamp, mocker):
     assert ("asctime" in formatter._fmt) == timestamp
 
 
-def test_configure_logging_makes_console_handler(mocker):
+def test_configure_logging_makes_queue_handler(mocker):
     mocker.patch('logging.Logger.addHandler')
     log.configure_logging()
     positional_args, _ = logging.Logger.addHandler.call_args
-    assert isinstance(positional_args[0], logging.StreamHandler)
+    assert isinstance(positional_args[0], logging.handlers.QueueHandler)
+
+
+def test_configure_logging_makes_console_handler(mocker):
+    log.configure_logging()
+    assert isinstance(log._QUEUE_LISTENER.handlers[0],
+                      logging.StreamHandler)
 
 
-def test_console_handler_gets_three_filters(mocker):
+def test_console_handler_gets_combined_filter(mocker):
     mocker.patch('logging.StreamHandler.addFilter')
     log.configure_logging()
     calls = logging.StreamHandler.addFilter.call_args_list
     filters = [positional_args[0] for positional_args, _ in calls]
-    assert isinstance(filters[0], log.StatsFilter)
-    assert isinstance(filters[1], log.DiagnosticsFilter)
-    assert isinstance(filters[2], log.MpiFilter)
+    assert len(filters) == 1
+    assert isinstance(filters[0], log.CombinedFilter)
+    assert filters[0]._stats_filter_out
+    assert filters[0]._diagnostics_filter_out
 
 
 def test_configure_logging_makes_stats_file_handler(mocker):
-    mocker.patch('logging.Logger.addHandler')
     log.configure_logging(stats_file="test.log")
-    positional_args, _ = logging.Logger.addHandler.call_args
-    assert isinstance(positional_args[0], logging.FileHandler)
+    handler = log._QUEUE_LISTENER.handlers[-1]
+    assert isinstance(handler, logging.handlers.MemoryHandler)
+    assert isinstance(handler.target, logging.FileHandler)
 
 
-def test_stats_file_handler_gets_three_filters(mocker):
+def test_stats_file_handler_gets_combined_filter(mocker):
     mocker.patch('logging.FileHandler.addFilter')
     log.configure_logging(stats_file="test.log")
     calls = logging.FileHandler.addFilter.call_args_list
     filters = [positional_args[0] for positional_args, _ in calls]
-    assert isinstance(filters[0], log.StatsFilter)
-    assert isinstance(filters[1], log.DiagnosticsFilter)
-    assert isinstance(filters[2], log.MpiFilter)
+    assert len(filters) == 1
+    assert isinstance(filters[0], log.CombinedFilter)
+    assert not filters[0]._stats_filter_out
+    assert filters[0]._diagnostics_filter_out
 
 
 def test_configure_logging_makes_diagnostics_file_handler(mocker):
-    mocker.patch('logging.Logger.addHandler')
     log.configure_logging(diagnostics_file="test.log")
-    positional_args, _ = logging.Logger.addHandler.call_args
-    assert isinstance(positional_args[0], logging.FileHandler)
+    handler = log._QUEUE_LISTENER.handlers[-1]
+    assert isinstance(handler, logging.handlers.MemoryHandler)
+    assert isinstance(handler.target, logging.FileHandler)
 
 
-def test_diagnostics_file_handler_gets_three_filters(mocker):
+def test_diagnostics_file_handler_gets_combined_filter(mocker):
     mocker.patch('logging.FileHandler.addFilter')
     log.configure_logging(diagnostics_file="test.log")
     calls = logging.FileHandler.addFilter.call_args_list
     filters = [positional_args[0] for positional_args, _ in calls]
-    assert isinstance(filters[0], log.StatsFilter)
-    assert isinstance(filters[1], log.DiagnosticsFilter)
-    assert isinstance(filters[2], log.MpiFilter)
+    assert len(filters) == 1
+    assert isinstance(filters[0], log.CombinedFilter)
+    assert filters[0]._stats_filter_out
+    assert not filters[0]._diagnostics_filter_out
 
 
 @pytest.mark.parametrize("level, mpi_on, mpi_rank, expected_filter",
@@ -132,4 +142,41 @@ def test_stats_filter(filter_out, stats_extra, mocker):
     assert stats_filter.filter(record) == expected_filter
 
 
+@pytest.mark.parametrize("stats_filter_out", [True, False])
+@pytest.mark.parametrize("stats_extra", [True, False, None])
+def test_combined_filter_stats(stats_filter_out, stats_extra, mocker):
+    log.USING_MPI = False
+    record = mocker.Mock()
+    if stats_extra is not None:
+        record.stats = stats_extra
+
+    combined_filter = log.CombinedFilter(stats_filter_out,
+                                         diagnostics_filter_out=True)
+    if stats_extra is None:
+        expected_filter = stats_filter_out
+    else:
+        expected_filter = stats_filter_out != stats_extra
+    assert combined_filter.filter(record) == expected_filter
+
+
+@pytest.mark.parametrize("level, mpi_on, mpi_rank, expected_filter",
+                         [(log.INFO, True, 0, True),
+                          (log.INFO, True, 1, False),
+                          (log.INFO, False, None, True),
+                          (log.DETAILED_INFO, True, 0, True),
+                          (log.DETAILED_INFO, True, 1, True),
+                          (log.DETAILED_INFO, False, None, True)])
+def test_combined_filter_mpi(level, mpi_on, mpi_rank, expected_filter,
+                             mocker):
+    log.USING_MPI = mpi_on
+    log.MPIRANK = mpi_rank
+    record = mocker.Mock()
+    record.levelno = level
+    record.msg = ""
+
+    combined_filter = log.CombinedFilter(stats_filter_out=True,
+                                         diagnostics_filter_out=True)
+    assert combined_filter.filter(record) == expected_filter
+
+
 